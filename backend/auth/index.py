@@ -1,5 +1,5 @@
 """
-Business: User authentication system - registration, login, profile management
+Business: User authentication system - registration, login, profile management with cached profile reads
 Args: event with httpMethod, body, queryStringParameters; context with request_id
 Returns: HTTP response with JWT token or user data
 """
@@ -8,6 +8,10 @@ import json
 import os
 import hashlib
 import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 import psycopg2
@@ -23,6 +27,78 @@ def get_db_connection():
     dsn = os.environ.get('DATABASE_URL')
     return psycopg2.connect(dsn, cursor_factory=RealDictCursor)
 
+class CacheBackend(ABC):
+    """Key/value cache interface; a shared backend (e.g. Redis) can implement the same methods."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        ...
+
+class LocalCacheBackend(CacheBackend):
+    """Bounded in-process LRU with per-entry TTL, kept warm between invocations of the same instance."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                    self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+user_cache = LocalCacheBackend(
+    max_entries=int(os.environ.get('CACHE_MAX_ENTRIES', '1000')),
+    ttl_seconds=float(os.environ.get('CACHE_TTL_SECONDS', '60'))
+)
+
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
     
@@ -40,6 +116,26 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         }
     
     try:
+        if method == 'GET':
+            params = event.get('queryStringParameters', {}) or {}
+
+            if params.get('cache_stats'):
+                return {
+                    'statusCode': 200,
+                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps({'user_cache': user_cache.stats()}),
+                    'isBase64Encoded': False
+                }
+
+            cached_user = user_cache.get(str(int(params['user_id']))) if params.get('user_id') else None
+            if cached_user is not None:
+                return {
+                    'statusCode': 200,
+                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps(cached_user, default=str),
+                    'isBase64Encoded': False
+                }
+
         conn = get_db_connection()
         cur = conn.cursor()
         
@@ -147,10 +243,13 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                         'isBase64Encoded': False
                     }
                 
+                user = dict(user)
+                user_cache.set(str(int(user_id)), user)
+                
                 return {
                     'statusCode': 200,
                     'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-                    'body': json.dumps(dict(user), default=str),
+                    'body': json.dumps(user, default=str),
                     'isBase64Encoded': False
                 }
         
@@ -196,6 +295,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             cur.execute(query, tuple(update_values))
             updated_user = dict(cur.fetchone())
             conn.commit()
+            user_cache.delete(str(int(user_id)))
             
             return {
                 'statusCode': 200,
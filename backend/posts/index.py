@@ -1,19 +1,246 @@
 """
-Business: Blog posts management and Instagram-like stories - create, read, update, track views
+Business: Blog posts management, home timeline feeds and Instagram-like stories - create, read, update, track views, follow
 Args: event with httpMethod, body, queryStringParameters; context with request_id
 Returns: HTTP response with post/story data or list
 """
 
 import json
 import os
-from typing import Dict, Any, List
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 
 def get_db_connection():
     dsn = os.environ.get('DATABASE_URL')
     return psycopg2.connect(dsn, cursor_factory=RealDictCursor)
 
+class CacheBackend(ABC):
+    """Key/value cache interface; a shared backend (e.g. Redis) can implement the same methods."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        ...
+
+class LocalCacheBackend(CacheBackend):
+    """Bounded in-process LRU with per-entry TTL, kept warm between invocations of the same instance."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                    self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+post_cache = LocalCacheBackend(
+    max_entries=int(os.environ.get('CACHE_MAX_ENTRIES', '1000')),
+    ttl_seconds=float(os.environ.get('CACHE_TTL_SECONDS', '30'))
+)
+
+class ViewBuffer:
+    """In-process post view increments, flushed to Postgres in one UPDATE once enough pile up."""
+
+    def __init__(self, flush_threshold: int, flush_interval: float):
+        self.flush_threshold = flush_threshold
+        self.flush_interval = flush_interval
+        self._counts: Dict[int, int] = {}
+        self._total = 0
+        self._oldest: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def add(self, post_id: int) -> int:
+        with self._lock:
+            self._counts[post_id] = self._counts.get(post_id, 0) + 1
+            self._total += 1
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            return self._counts[post_id]
+
+    def pending(self, post_id: int) -> int:
+        with self._lock:
+            return self._counts.get(post_id, 0)
+
+    def due(self) -> bool:
+        with self._lock:
+            return self._total >= self.flush_threshold or (
+                self._oldest is not None and time.monotonic() - self._oldest >= self.flush_interval)
+
+    def drain(self) -> Dict[int, int]:
+        with self._lock:
+            counts, self._counts, self._total, self._oldest = self._counts, {}, 0, None
+            return counts
+
+    def restore(self, counts: Dict[int, int]) -> None:
+        with self._lock:
+            for post_id, count in counts.items():
+                self._counts[post_id] = self._counts.get(post_id, 0) + count
+                self._total += count
+            if counts and self._oldest is None:
+                self._oldest = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'pending_views': self._total, 'pending_posts': len(self._counts)}
+
+view_buffer = ViewBuffer(
+    flush_threshold=int(os.environ.get('VIEW_FLUSH_THRESHOLD', '100')),
+    flush_interval=float(os.environ.get('VIEW_FLUSH_SECONDS', '10'))
+)
+
+def flush_views(conn, cur) -> None:
+    counts = view_buffer.drain()
+    if not counts:
+        return
+
+    try:
+        execute_values(cur, """
+            UPDATE posts SET views = posts.views + v.n
+            FROM (VALUES %s) AS v(id, n)
+            WHERE posts.id = v.id
+        """, list(counts.items()), template='(%s::integer, %s::integer)', page_size=len(counts))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        view_buffer.restore(counts)
+        raise
+
+    # Cached entries carry the pre-flush counter; drop them so the next read sees the new total
+    for post_id in counts:
+        post_cache.delete(str(post_id))
+
+# Authors with more followers than this are not fanned out on write;
+# their posts are merged into followers' feeds at read time instead.
+FANOUT_FOLLOWER_LIMIT = int(os.environ.get('FANOUT_FOLLOWER_LIMIT', '5000'))
+# Recent posts copied into timelines on follow, or when an author drops back to the limit.
+FOLLOW_BACKFILL_LIMIT = 50
+# Per-user home_timeline retention; older entries are trimmed after every write.
+TIMELINE_MAX_ENTRIES = 800
+
+MAX_BATCH_SIZE = 500
+# Newest published posts of one batch that are fanned out; older ones stay off home timelines.
+BATCH_FANOUT_LIMIT = 20
+# Text columns checked before a batch INSERT; None means unbounded TEXT.
+POST_TEXT_FIELDS = {'title': 500, 'content': None, 'excerpt': None, 'cover_image_url': None, 'post_type': 50, 'category': 100}
+MESSAGE_TEXT_FIELDS = {'content': None}
+
+def parse_id(value: Any) -> Optional[int]:
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        return None
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed > 0 else None
+
+def text_field_error(item: Dict[str, Any], limits: Dict[str, Optional[int]]) -> Optional[str]:
+    for field, max_length in limits.items():
+        value = item.get(field)
+        if value is None:
+            continue
+        if not isinstance(value, str):
+            return f'{field} must be a string'
+        if max_length is not None and len(value) > max_length:
+            return f'{field} must be at most {max_length} characters'
+    return None
+
+def trim_timelines(cur, user_ids: Optional[List[int]] = None, author_ids: Optional[List[int]] = None) -> None:
+    """Keep only the newest TIMELINE_MAX_ENTRIES rows for the given users and the fanned-out followers of author_ids."""
+    cur.execute("""
+        DELETE FROM home_timeline ht
+        USING (
+            SELECT t.user_id, c.created_at, c.post_id
+            FROM (
+                SELECT unnest(%s::integer[]) AS user_id
+                UNION
+                SELECT f.follower_id FROM follows f
+                JOIN users a ON a.id = f.following_id AND COALESCE(a.followers_count, 0) <= %s
+                WHERE f.following_id = ANY(%s::integer[])
+            ) t
+            CROSS JOIN LATERAL (
+                SELECT created_at, post_id FROM home_timeline
+                WHERE user_id = t.user_id
+                ORDER BY created_at DESC, post_id DESC
+                OFFSET %s LIMIT 1
+            ) c
+        ) cutoff
+        WHERE ht.user_id = cutoff.user_id
+          AND (ht.created_at, ht.post_id) <= (cutoff.created_at, cutoff.post_id)
+    """, (list(user_ids or []), FANOUT_FOLLOWER_LIMIT, list(author_ids or []), TIMELINE_MAX_ENTRIES))
+
+def fan_out_posts(cur, posts: List[tuple]) -> None:
+    """posts: list of (post_id, author_id, created_at) for published posts."""
+    if not posts:
+        return
+
+    execute_values(cur, """
+        WITH v(post_id, author_id, created_at, fanout_limit) AS (VALUES %s)
+        INSERT INTO home_timeline (user_id, post_id, author_id, created_at)
+        SELECT v.author_id, v.post_id, v.author_id, v.created_at FROM v
+        UNION ALL
+        SELECT f.follower_id, v.post_id, v.author_id, v.created_at
+        FROM v
+        JOIN users a ON a.id = v.author_id AND COALESCE(a.followers_count, 0) <= v.fanout_limit
+        JOIN follows f ON f.following_id = v.author_id
+        ON CONFLICT (user_id, post_id) DO NOTHING
+    """, [(post_id, author_id, created_at, FANOUT_FOLLOWER_LIMIT) for post_id, author_id, created_at in posts],
+        template='(%s::integer, %s::integer, %s::timestamp, %s::integer)', page_size=len(posts))
+
+    author_ids = list({int(author_id) for _, author_id, _ in posts})
+    trim_timelines(cur, user_ids=author_ids, author_ids=author_ids)
+
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
     
@@ -31,11 +258,44 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         }
     
     try:
+        if method == 'GET':
+            params = event.get('queryStringParameters', {}) or {}
+
+            if params.get('cache_stats'):
+                return {
+                    'statusCode': 200,
+                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps({'post_cache': post_cache.stats(), 'view_buffer': view_buffer.stats()}),
+                    'isBase64Encoded': False
+                }
+
+            # Single-post cache hits are served without a connection unless buffered views are due
+            if params.get('id') and not params.get('messages') and not params.get('stories') and params.get('feed') != 'home':
+                cached_id = int(params['id'])
+                post = post_cache.get(str(cached_id))
+
+                if post is not None:
+                    pending = view_buffer.add(cached_id)
+                    body = json.dumps({**post, 'views': (post['views'] or 0) + pending}, default=str)
+
+                    if view_buffer.due():
+                        conn = get_db_connection()
+                        cur = conn.cursor()
+                        flush_views(conn, cur)
+                        cur.close()
+                        conn.close()
+
+                    return {
+                        'statusCode': 200,
+                        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                        'body': body,
+                        'isBase64Encoded': False
+                    }
+
         conn = get_db_connection()
         cur = conn.cursor()
         
         if method == 'GET':
-            params = event.get('queryStringParameters', {}) or {}
             post_id = params.get('id')
             post_type = params.get('type')
             user_id = params.get('user_id')
@@ -43,7 +303,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             stories_mode = params.get('stories')
             messages_mode = params.get('messages')
             chat_with = params.get('chat_with')
-            
+            feed = params.get('feed')
+            before = params.get('before')
+
             if messages_mode:
                 if not user_id:
                     cur.close()
@@ -157,7 +419,75 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     'body': json.dumps(stories, default=str),
                     'isBase64Encoded': False
                 }
-            
+
+            if feed == 'home':
+                if not user_id:
+                    cur.close()
+                    conn.close()
+                    return {
+                        'statusCode': 400,
+                        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                        'body': json.dumps({'error': 'user_id required'}),
+                        'isBase64Encoded': False
+                    }
+
+                # Keyset cursor on (created_at, post_id): posts from one batch share created_at
+                before_id = int(params.get('before_id', '2147483647')) if before else None
+
+                cur.execute("""
+                    WITH entries AS (
+                        (SELECT ht.post_id, ht.created_at
+                         FROM home_timeline ht
+                         WHERE ht.user_id = %s
+                           AND (%s::timestamp IS NULL OR (ht.created_at, ht.post_id) < (%s::timestamp, %s::integer))
+                         ORDER BY ht.created_at DESC, ht.post_id DESC
+                         LIMIT %s)
+                        UNION
+                        (SELECT cp.id, cp.created_at
+                         FROM follows f
+                         JOIN users a ON a.id = f.following_id AND a.followers_count > %s
+                         CROSS JOIN LATERAL (
+                             SELECT p2.id, p2.created_at FROM posts p2
+                             WHERE p2.user_id = f.following_id AND p2.published = true
+                               AND (%s::timestamp IS NULL OR (p2.created_at, p2.id) < (%s::timestamp, %s::integer))
+                             ORDER BY p2.created_at DESC, p2.id DESC
+                             LIMIT %s
+                         ) cp
+                         WHERE f.follower_id = %s)
+                    ),
+                    page AS (
+                        SELECT post_id, created_at FROM entries
+                        ORDER BY created_at DESC, post_id DESC
+                        LIMIT %s
+                    )
+                    SELECT p.*, u.username, u.full_name, u.avatar_url,
+                           (SELECT COUNT(*) FROM likes WHERE post_id = p.id) as likes_count,
+                           (SELECT COUNT(*) FROM comments WHERE post_id = p.id) as comments_count
+                    FROM page
+                    JOIN posts p ON p.id = page.post_id
+                    JOIN users u ON p.user_id = u.id
+                    WHERE p.published = true
+                    ORDER BY page.created_at DESC, page.post_id DESC
+                """, (user_id, before, before, before_id, limit,
+                      FANOUT_FOLLOWER_LIMIT, before, before, before_id, limit, user_id,
+                      limit))
+
+                posts = [dict(row) for row in cur.fetchall()]
+                cur.close()
+                conn.close()
+                return {
+                    'statusCode': 200,
+                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps({
+                        'posts': posts,
+                        'next_cursor': {
+                            'before': posts[-1]['created_at'],
+                            'before_id': posts[-1]['id']
+                        } if posts else None
+                    }, default=str),
+                    'isBase64Encoded': False
+                }
+
             if post_id:
                 cur.execute(
                     """SELECT p.*, u.username, u.full_name, u.avatar_url,
@@ -171,20 +501,29 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 post = cur.fetchone()
                 
                 if not post:
+                    cur.close()
+                    conn.close()
                     return {
                         'statusCode': 404,
                         'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
                         'body': json.dumps({'error': 'Post not found'}),
                         'isBase64Encoded': False
                     }
-                
-                cur.execute("UPDATE posts SET views = views + 1 WHERE id = %s", (post_id,))
-                conn.commit()
+
+                post = dict(post)
+                post_cache.set(str(int(post_id)), post)
+                pending = view_buffer.add(int(post_id))
+                body = json.dumps({**post, 'views': (post['views'] or 0) + pending}, default=str)
+
+                if view_buffer.due():
+                    flush_views(conn, cur)
+                cur.close()
+                conn.close()
                 
                 return {
                     'statusCode': 200,
                     'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-                    'body': json.dumps(dict(post), default=str),
+                    'body': body,
                     'isBase64Encoded': False
                 }
             
@@ -340,7 +679,213 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     'body': json.dumps({'success': True}),
                     'isBase64Encoded': False
                 }
-            
+
+            elif action in ('create_posts', 'send_messages'):
+                items = body_data.get('posts' if action == 'create_posts' else 'messages')
+
+                if not isinstance(items, list) or not items or len(items) > MAX_BATCH_SIZE:
+                    cur.close()
+                    conn.close()
+                    return {
+                        'statusCode': 400,
+                        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                        'body': json.dumps({'error': f'Expected a non-empty array of at most {MAX_BATCH_SIZE} items'}),
+                        'isBase64Encoded': False
+                    }
+
+                required = ['user_id', 'title', 'content'] if action == 'create_posts' else ['sender_id', 'receiver_id', 'content']
+                user_fields = ['user_id'] if action == 'create_posts' else ['sender_id', 'receiver_id']
+                results: List[Dict[str, Any]] = [{'index': i, 'status': 'error', 'error': 'Missing required fields'} for i in range(len(items))]
+                candidates = []
+
+                for i, item in enumerate(items):
+                    if not isinstance(item, dict) or not all([item.get(f) for f in required]):
+                        continue
+                    ids = {f: parse_id(item[f]) for f in user_fields}
+                    if None in ids.values():
+                        results[i]['error'] = f"{', '.join(user_fields)} must be integers"
+                        continue
+                    text_error = text_field_error(item, POST_TEXT_FIELDS if action == 'create_posts' else MESSAGE_TEXT_FIELDS)
+                    if text_error:
+                        results[i]['error'] = text_error
+                        continue
+                    if action == 'create_posts':
+                        tags = item.get('tags', [])
+                        if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+                            results[i]['error'] = 'tags must be an array of strings'
+                            continue
+                        published = item.get('published', True)
+                        if not isinstance(published, bool):
+                            results[i]['error'] = 'published must be a boolean'
+                            continue
+                        candidates.append((i, ids, None, (ids['user_id'], item['title'], item['content'], item.get('excerpt', ''),
+                                                          item.get('cover_image_url', ''), item.get('post_type', 'blog'),
+                                                          item.get('category', ''), tags, published)))
+                    else:
+                        story_id = None
+                        if item.get('story_id') is not None:
+                            story_id = parse_id(item['story_id'])
+                            if story_id is None:
+                                results[i]['error'] = 'story_id must be an integer'
+                                continue
+                        candidates.append((i, ids, story_id, (ids['sender_id'], ids['receiver_id'], item['content'], story_id)))
+
+                cur.execute("SELECT id FROM users WHERE id = ANY(%s)",
+                            (list({uid for _, ids, _, _ in candidates for uid in ids.values()}),))
+                known_users = {row['id'] for row in cur.fetchall()}
+                cur.execute("SELECT id FROM stories WHERE id = ANY(%s)",
+                            (list({sid for _, _, sid, _ in candidates if sid is not None}),))
+                known_stories = {row['id'] for row in cur.fetchall()}
+
+                valid_indexes = []
+                rows = []
+                for i, ids, story_id, row in candidates:
+                    if not set(ids.values()) <= known_users:
+                        results[i]['error'] = 'User not found'
+                    elif story_id is not None and story_id not in known_stories:
+                        results[i]['error'] = 'Story not found'
+                    else:
+                        valid_indexes.append(i)
+                        rows.append(row)
+
+                if rows:
+                    try:
+                        if action == 'create_posts':
+                            inserted = execute_values(cur, """
+                                INSERT INTO posts (user_id, title, content, excerpt, cover_image_url, post_type, category, tags, published)
+                                VALUES %s
+                                RETURNING id, user_id, title, published, created_at
+                            """, rows, page_size=len(rows), fetch=True)
+                            newest = sorted((p for p in inserted if p['published']), key=lambda p: p['id'], reverse=True)
+                            fan_out_posts(cur, [(p['id'], p['user_id'], p['created_at']) for p in newest[:BATCH_FANOUT_LIMIT]])
+                        else:
+                            inserted = execute_values(cur, """
+                                INSERT INTO messages (sender_id, receiver_id, content, story_id)
+                                VALUES %s
+                                RETURNING id, sender_id, receiver_id, content, story_id, is_read, created_at
+                            """, rows, page_size=len(rows), fetch=True)
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        cur.close()
+                        conn.close()
+                        raise
+
+                    key = 'post' if action == 'create_posts' else 'message'
+                    for i, row in zip(valid_indexes, inserted):
+                        results[i] = {'index': i, 'status': 'created', key: dict(row)}
+
+                cur.close()
+                conn.close()
+
+                return {
+                    'statusCode': 201 if action == 'send_messages' else 200,
+                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps({
+                        'created': len(rows),
+                        'failed': len(items) - len(rows),
+                        'results': results
+                    }, default=str),
+                    'isBase64Encoded': False
+                }
+
+            elif action in ('follow', 'unfollow'):
+                follower_id = parse_id(body_data.get('follower_id'))
+                following_id = parse_id(body_data.get('following_id'))
+
+                if not all([follower_id, following_id]) or follower_id == following_id:
+                    cur.close()
+                    conn.close()
+                    return {
+                        'statusCode': 400,
+                        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                        'body': json.dumps({'error': 'Invalid follower_id or following_id'}),
+                        'isBase64Encoded': False
+                    }
+
+                cur.execute("SELECT COUNT(*) AS found FROM users WHERE id IN (%s, %s)", (follower_id, following_id))
+                if cur.fetchone()['found'] < 2:
+                    cur.close()
+                    conn.close()
+                    return {
+                        'statusCode': 400,
+                        'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                        'body': json.dumps({'error': 'User not found'}),
+                        'isBase64Encoded': False
+                    }
+
+                if action == 'follow':
+                    cur.execute("""
+                        INSERT INTO follows (follower_id, following_id)
+                        VALUES (%s, %s)
+                        ON CONFLICT (follower_id, following_id) DO NOTHING
+                        RETURNING id
+                    """, (follower_id, following_id))
+
+                    if cur.fetchone():
+                        cur.execute("""
+                            UPDATE users SET followers_count = COALESCE(followers_count, 0) + 1
+                            WHERE id = %s
+                            RETURNING followers_count
+                        """, (following_id,))
+                        author = cur.fetchone()
+
+                        if author and author['followers_count'] <= FANOUT_FOLLOWER_LIMIT:
+                            cur.execute("""
+                                INSERT INTO home_timeline (user_id, post_id, author_id, created_at)
+                                SELECT %s, id, user_id, created_at FROM posts
+                                WHERE user_id = %s AND published = true
+                                ORDER BY created_at DESC, id DESC
+                                LIMIT %s
+                                ON CONFLICT (user_id, post_id) DO NOTHING
+                            """, (follower_id, following_id, FOLLOW_BACKFILL_LIMIT))
+                            trim_timelines(cur, user_ids=[follower_id])
+                else:
+                    cur.execute("""
+                        DELETE FROM follows WHERE follower_id = %s AND following_id = %s
+                        RETURNING id
+                    """, (follower_id, following_id))
+
+                    if cur.fetchone():
+                        cur.execute("""
+                            UPDATE users SET followers_count = GREATEST(COALESCE(followers_count, 0) - 1, 0)
+                            WHERE id = %s
+                            RETURNING followers_count
+                        """, (following_id,))
+                        author = cur.fetchone()
+                        cur.execute("""
+                            DELETE FROM home_timeline WHERE user_id = %s AND author_id = %s
+                        """, (follower_id, following_id))
+
+                        # Author drops back to fan-out-on-write: their recent posts were only
+                        # merged at read time, so write them into every follower's timeline.
+                        if author and author['followers_count'] == FANOUT_FOLLOWER_LIMIT:
+                            cur.execute("""
+                                INSERT INTO home_timeline (user_id, post_id, author_id, created_at)
+                                SELECT f.follower_id, rp.id, rp.user_id, rp.created_at
+                                FROM follows f
+                                CROSS JOIN (
+                                    SELECT id, user_id, created_at FROM posts
+                                    WHERE user_id = %s AND published = true
+                                    ORDER BY created_at DESC, id DESC
+                                    LIMIT %s
+                                ) rp
+                                WHERE f.following_id = %s
+                                ON CONFLICT (user_id, post_id) DO NOTHING
+                            """, (following_id, FOLLOW_BACKFILL_LIMIT, following_id))
+                            trim_timelines(cur, author_ids=[following_id])
+
+                conn.commit()
+                cur.close()
+                conn.close()
+
+                return {
+                    'statusCode': 200,
+                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps({'success': True}),
+                    'isBase64Encoded': False
+                }
+
             user_id = body_data.get('user_id')
             title = body_data.get('title')
             content = body_data.get('content')
@@ -366,6 +911,8 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 (user_id, title, content, excerpt, cover_image_url, post_type, category, tags, published)
             )
             post = dict(cur.fetchone())
+            if published:
+                fan_out_posts(cur, [(post['id'], user_id, post['created_at'])])
             conn.commit()
             
             return {
@@ -0,0 +1,31 @@
+-- Create follows table
+CREATE TABLE IF NOT EXISTS follows (
+    id SERIAL PRIMARY KEY,
+    follower_id INTEGER NOT NULL,
+    following_id INTEGER NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(follower_id, following_id),
+    FOREIGN KEY (follower_id) REFERENCES users(id),
+    FOREIGN KEY (following_id) REFERENCES users(id)
+);
+
+-- Denormalized follower count, used to pick fan-out-on-write vs fan-out-on-read
+ALTER TABLE users ADD COLUMN IF NOT EXISTS followers_count INTEGER DEFAULT 0;
+
+-- Precomputed per-user home timeline (post ids only)
+CREATE TABLE IF NOT EXISTS home_timeline (
+    user_id INTEGER NOT NULL,
+    post_id INTEGER NOT NULL,
+    author_id INTEGER NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (user_id, post_id),
+    FOREIGN KEY (user_id) REFERENCES users(id),
+    FOREIGN KEY (post_id) REFERENCES posts(id),
+    FOREIGN KEY (author_id) REFERENCES users(id)
+);
+
+-- Create index for faster queries
+CREATE INDEX IF NOT EXISTS idx_follows_following_id ON follows(following_id);
+CREATE INDEX IF NOT EXISTS idx_home_timeline_user_created ON home_timeline(user_id, created_at DESC, post_id DESC);
+CREATE INDEX IF NOT EXISTS idx_home_timeline_user_author ON home_timeline(user_id, author_id);
+CREATE INDEX IF NOT EXISTS idx_posts_user_created ON posts(user_id, created_at DESC, id DESC);